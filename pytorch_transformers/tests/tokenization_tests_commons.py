@@ -131,6 +131,19 @@ class CommonTestCases:
             self.assertEqual(tokens[0], tokenizer.convert_tokens_to_ids(tokenizer.eos_token))
             self.assertEqual(tokens[-2], tokenizer.convert_tokens_to_ids(tokenizer.pad_token))
 
+        def test_convert_ids_to_tokens_skip_special_tokens(self):
+            tokenizer = self.get_tokenizer()
+            tokenizer.add_special_tokens({'eos_token': ">>>>|||<||<<|<<"})
+
+            ids = tokenizer.encode(">>>>|||<||<<|<< aaaaabbbbbb >>>>|||<||<<|<<")
+            tokens = tokenizer.convert_ids_to_tokens(ids)
+            tokens_skipped = tokenizer.convert_ids_to_tokens(ids, skip_special_tokens=True)
+
+            self.assertIn(tokenizer.eos_token, tokens)
+            self.assertNotIn(tokenizer.eos_token, tokens_skipped)
+            self.assertListEqual(tokens_skipped,
+                                 [t for t in tokens if t not in tokenizer.all_special_tokens])
+
 
         def test_required_methods_tokenizer(self):
             tokenizer = self.get_tokenizer()
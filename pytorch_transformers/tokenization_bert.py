@@ -65,20 +65,18 @@ PRETRAINED_POSITIONAL_EMBEDDINGS_SIZES = {
 
 def load_vocab(vocab_file):
     """Loads a vocabulary file into a dictionary."""
-    vocab = collections.OrderedDict()
     with open(vocab_file, "r", encoding="utf-8") as reader:
-        tokens = reader.readlines()
-    for index, token in enumerate(tokens):
-        token = token.rstrip('\n')
-        vocab[token] = index
+        tokens = reader.read().split('\n')
+    # A trailing newline leaves an empty last item which is not a token
+    if not tokens[-1]:
+        tokens.pop()
+    vocab = collections.OrderedDict(zip(tokens, range(len(tokens))))
     return vocab
 
 
 def whitespace_tokenize(text):
     """Runs basic whitespace cleaning and splitting on a piece of text."""
-    text = text.strip()
-    if not text:
-        return []
+    # str.split() without a separator already drops leading/trailing whitespace
     tokens = text.split()
     return tokens
 
@@ -251,8 +249,8 @@ class BasicTokenizer(object):
                 token = self._run_strip_accents(token)
             split_tokens.extend(self._run_split_on_punc(token))
 
-        output_tokens = whitespace_tokenize(" ".join(split_tokens))
-        return output_tokens
+        # The pieces are already whitespace-free and non-empty: no need to re-join and re-split them
+        return split_tokens
 
     def _run_strip_accents(self, text):
         """Strips accents from a piece of text."""
@@ -167,12 +167,12 @@ class GPT2Tokenizer(PreTrainedTokenizer):
     def _tokenize(self, text):
         """ Tokenize a string. """
         bpe_tokens = []
-        for token in re.findall(self.pat, text):
+        for token in self.pat.findall(text):
             if sys.version_info[0] == 2:
                 token = ''.join(self.byte_encoder[ord(b)] for b in token)
             else:
                 token = ''.join(self.byte_encoder[b] for b in token.encode('utf-8'))
-            bpe_tokens.extend(bpe_token for bpe_token in self.bpe(token).split(' '))
+            bpe_tokens.extend(self.bpe(token).split(' '))
         return bpe_tokens
 
     def _convert_token_to_id(self, token):
@@ -479,8 +479,12 @@ class PreTrainedTokenizer(object):
                 return self._tokenize(text, **kwargs)
             tok = tok_list[0]
             split_text = text.split(tok)
-            return sum((split_on_tokens(tok_list[1:], sub_text.strip()) + [tok] \
-                        for sub_text in split_text), [])[:-1]
+            # Extend a single list in place rather than summing lists, which copies at each step
+            tokenized_text = []
+            for sub_text in split_text:
+                tokenized_text.extend(split_on_tokens(tok_list[1:], sub_text.strip()))
+                tokenized_text.append(tok)
+            return tokenized_text[:-1]
 
         added_tokens = list(self.added_tokens_encoder.keys()) + self.all_special_tokens
         tokenized_text = split_on_tokens(added_tokens, text)
@@ -502,9 +506,11 @@ class PreTrainedTokenizer(object):
         if isinstance(tokens, str) or (six.PY2 and isinstance(tokens, unicode)):
             return self._convert_token_to_id_with_added_voc(tokens)
 
-        ids = []
-        for token in tokens:
-            ids.append(self._convert_token_to_id_with_added_voc(token))
+        if self.added_tokens_encoder:
+            ids = [self._convert_token_to_id_with_added_voc(token) for token in tokens]
+        else:
+            # Fast path: without added tokens we can go straight to the base vocabulary
+            ids = [self._convert_token_to_id(token) for token in tokens]
         if len(ids) > self.max_len:
             logger.warning("Token indices sequence length is longer than the specified maximum sequence length "
                            "for this model ({} > {}). Running this sequence through the model will result in "
@@ -540,9 +546,11 @@ class PreTrainedTokenizer(object):
                 return self.added_tokens_decoder[ids]
             else:
                 return self._convert_id_to_token(ids)
+        # Resolve the special tokens ids once instead of once per index
+        all_special_ids = set(self.all_special_ids) if skip_special_tokens else set()
         tokens = []
         for index in ids:
-            if index in self.all_special_ids and skip_special_tokens:
+            if index in all_special_ids:
                 continue
             if index in self.added_tokens_decoder:
                 tokens.append(self.added_tokens_decoder[index])
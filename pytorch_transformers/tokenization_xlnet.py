@@ -106,7 +106,7 @@ class XLNetTokenizer(PreTrainedTokenizer):
 
     def preprocess_text(self, inputs):
         if self.remove_space:
-            outputs = ' '.join(inputs.strip().split())
+            outputs = ' '.join(inputs.split())
         else:
             outputs = inputs
         outputs = outputs.replace("``", '"').replace("''", '"')